@@ -1,16 +1,90 @@
-import io
+from __future__ import annotations
+
+import asyncio
+import json
+import os
 import re
+import struct
+import sys
 import typing
-import wave
-from os.path import join
+from array import array
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from os import listdir
+from os.path import dirname, isdir, isfile, join
 from pathlib import Path
-from threading import Lock
+from tempfile import TemporaryDirectory
+from threading import BoundedSemaphore, Event, Lock
 
 from mimic3_tts import AudioResult, Mimic3Settings, Mimic3TextToSpeechSystem, SSMLSpeaker
 from ovos_plugin_manager.tts import TTS
 from ovos_utils.xdg_utils import xdg_data_home
 from ovos_utils.log import LOG
 
+# coalesce the many small per-chunk writes into few large syscalls
+_WAV_BUFFER_SIZE = 512 * 1024
+
+# canonical 44 byte PCM WAV header, written directly instead of via the wave module
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+_WAV_HEADER_SIZE = _WAV_HEADER.size
+_BIG_ENDIAN = sys.byteorder == "big"
+# streamed audio has no known length, use the max size like other streaming encoders
+_STREAM_DATA_SIZE = 0xFFFFFFFF - 36
+
+# config keys passed as is to Mimic3Settings
+_MIMIC3_SETTINGS = ("voices_url_format", "length_scale", "noise_scale", "noise_w")
+
+# text hacks, compiled once at import instead of on every sentence
+_AMPM_RE = re.compile(r" ([ap])\.m\.")
+_ACRONYM_RE = re.compile(r"\b([A-Z](?: |$)){2,}")
+_SPELL_RE = re.compile(r"'([A-Z])'")
+_SSML_RE = re.compile(r"\s*<")
+
+
+def _wav_header(sample_rate: int, sample_width: int, channels: int, data_size: int) -> bytes:
+    """44 byte RIFF/WAVE header for PCM audio"""
+    return _WAV_HEADER.pack(
+        b"RIFF", 36 + data_size, b"WAVE",
+        b"fmt ", 16, 1, channels, sample_rate,
+        sample_rate * channels * sample_width, channels * sample_width, sample_width * 8,
+        b"data", data_size
+    )
+
+
+def _pcm_bytes(result: AudioResult) -> bytes:
+    """little endian PCM bytes of an AudioResult, as stored in WAV files"""
+    audio = result.audio_bytes
+    if _BIG_ENDIAN and result.sample_width_bytes == 2:
+        # mimic3 emits native endian PCM
+        pcm = array("h", audio)
+        pcm.byteswap()
+        audio = pcm.tobytes()
+    return audio
+
+
+@contextmanager
+def _override_speaker(engine: Mimic3TextToSpeechSystem, speaker: typing.Optional[str]):
+    """Temporarily switch the engine speaker, the default is always restored
+
+    SSML <voice> tags switch the engine voice back and forth, which resets
+    the speaker even when no speaker was requested
+    """
+    default = engine.speaker
+    if speaker and speaker != default:
+        engine.speaker = speaker
+    try:
+        yield engine
+    finally:
+        engine.speaker = default
+
+
+def _acronym_repl(match: re.Match) -> str:
+    """A I -> A.I."""
+    # the match starts with a letter, only a trailing space needs dropping
+    return match.group(0).replace(" ", ".").rstrip(".") + ". "
+
 
 class Mimic3TTSPlugin(TTS):
     """Mycroft interface to Mimic3."""
@@ -54,44 +128,165 @@ class Mimic3TTSPlugin(TTS):
                 config["voice"] = voice
                 config["speaker"] = speaker
         super().__init__(lang, config, ssml_tags=ssml_tags)
-        self.speaker = self.config.get("speaker")
-        self.lock = Lock()
-        self.lang = self.config.get("language") or self.lang
-        preload_voices = self.config.get("preload_voices") or []
-        preload_langs = self.config.get("preload_langs") or [self.lang]
-
-        voice_dl = self.config.get("voices_download_dir") or join(xdg_data_home(), "mycroft", "mimic3", "voices")
-        voice_dirs = self.config.get("voices_directories") or [voice_dl]
-
-        self.tts = Mimic3TextToSpeechSystem(
-            Mimic3Settings(
-                voice=self.voice,
-                language=self.lang,
-                voices_directories=voice_dirs,
-                voices_url_format=self.config.get("voices_url_format"),
-                speaker=self.speaker,
-                length_scale=self.config.get("length_scale"),
-                noise_scale=self.config.get("noise_scale"),
-                noise_w=self.config.get("noise_w"),
-                voices_download_dir=voice_dl,
-                use_deterministic_compute=self.config.get(
-                    "use_deterministic_compute", False
-                ),
-            )
+        get = self.config.get
+        self.speaker = get("speaker")
+        self.lang = get("language") or self.lang
+        preload_voices = get("preload_voices") or []
+        preload_langs = get("preload_langs") or [self.lang]
+
+        voice_dl = get("voices_download_dir") or join(xdg_data_home(), "mycroft", "mimic3", "voices")
+        voice_dirs = get("voices_directories") or [voice_dl]
+
+        # shared kwargs for every Mimic3Settings, only voice/speaker differ per engine
+        self._settings = {key: get(key) for key in _MIMIC3_SETTINGS}
+        self._settings.update(
+            language=self.lang,
+            voices_directories=voice_dirs,
+            voices_download_dir=voice_dl,
+            use_deterministic_compute=get("use_deterministic_compute", False),
         )
 
+        # one engine per voice, each engine has its own lock so requests
+        # for different voices can be synthesized concurrently
+        self._engines: typing.Dict[str, typing.Tuple[Mimic3TextToSpeechSystem, Lock]] = {}
+        self._engines_lock = Lock()
+        self._sem = BoundedSemaphore(get("concurrent_requests", 3))
+
+        self.tts, _ = self._get_engine(self.voice, self.speaker)
+
+        # opt-in LRU cache of synthesized wav files, repeated prompts skip inference.
+        # disabled by default, ovos-plugin-manager already caches in front of get_tts
+        # and every cached sentence is a full wav kept in memory
+        self._wav_cache: OrderedDict[tuple, bytes] = OrderedDict()
+        self._wav_cache_size = get("wav_cache_size", 0)
+        self._wav_cache_lock = Lock()
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=1)
+        self._voices: typing.Optional[list] = None
+        self._warmup = get("warmup", True)
+
+        # per instance copy, registering this instance's voice must not change
+        # the defaults (and cached lookups) of other plugin instances
+        self.default_voices = dict(self.default_voices)
         if self.voice:
             self.default_voices[self.lang] = self.voice
 
-        for voice in preload_voices:
-            self.tts.preload_voice(voice)
+        # lang -> default voice lookups are done on every request
+        self._voice_cache: typing.Dict[str, typing.Optional[str]] = {}
 
+        voices = list(preload_voices)
         for lang in preload_langs:
-            if lang not in self.default_voices:
-                lang = lang.split("-")[0]
-            voice = self.default_voices.get(lang)
+            voice = self._resolve_voice(lang)
             if voice:
-                self.tts.preload_voice(voice)
+                voices.append(voice)
+        voices = list(dict.fromkeys(voices))  # dedup, keep order
+
+        # start reading every model into the page cache before loading the first
+        for voice in voices:
+            self._prefetch_voice_files(voice)
+
+        # model loading is mostly disk I/O and native onnxruntime code that
+        # releases the GIL, so loading several voices in threads overlaps well
+        if get("parallel_preload", True) and len(voices) > 1:
+            with ThreadPoolExecutor(max_workers=min(4, len(voices))) as ex:
+                list(ex.map(self._preload_voice, voices))
+        else:
+            for voice in voices:
+                self._preload_voice(voice)
+
+    def _resolve_voice(self, lang: str) -> typing.Optional[str]:
+        """Return the default voice for a lang, falling back to the base lang"""
+        try:
+            return self._voice_cache[lang]
+        except KeyError:
+            pass
+        key = lang if lang in self.default_voices else lang.split("-")[0]
+        voice = self._voice_cache[lang] = self.default_voices.get(key)
+        return voice
+
+    def _make_engine(self, voice: str, speaker: str = None) -> Mimic3TextToSpeechSystem:
+        """Create a new Mimic3 engine bound to a voice, speaker is the engine default"""
+        return Mimic3TextToSpeechSystem(
+            Mimic3Settings(voice=voice, speaker=speaker, **self._settings)
+        )
+
+    def _get_engine(self, voice: str, speaker: str = None) -> \
+            typing.Tuple[Mimic3TextToSpeechSystem, Lock]:
+        """Return the (engine, lock) pair for a voice, creating it on first use
+
+        speaker is only used as the default speaker of a newly created engine,
+        per request speakers are applied with _override_speaker
+        """
+        # engines are never removed, a plain dict read is safe without the lock
+        engine = self._engines.get(voice)
+        if engine is not None:
+            return engine
+        with self._engines_lock:
+            if voice not in self._engines:
+                self._engines[voice] = (self._make_engine(voice, speaker), Lock())
+            return self._engines[voice]
+
+    def _cache_key(self, sentence: str, voice: str, speaker: str, ssml: bool) -> tuple:
+        return (voice, speaker, self._settings["length_scale"], self._settings["noise_scale"],
+                self._settings["noise_w"], ssml, sentence)
+
+    def _cache_get(self, key: tuple) -> typing.Optional[bytes]:
+        if not self._wav_cache_size:
+            return None
+        with self._wav_cache_lock:
+            wav_bytes = self._wav_cache.get(key)
+            if wav_bytes is not None:
+                self._wav_cache.move_to_end(key)
+            return wav_bytes
+
+    def _cache_put(self, key: tuple, wav_bytes: bytes):
+        if not self._wav_cache_size:
+            return
+        with self._wav_cache_lock:
+            self._wav_cache[key] = wav_bytes
+            self._wav_cache.move_to_end(key)
+            while len(self._wav_cache) > self._wav_cache_size:
+                self._wav_cache.popitem(last=False)
+
+    def _prefetch_voice_files(self, voice: str):
+        """Ask the kernel to read the voice files into the page cache in the background"""
+        if not hasattr(os, "posix_fadvise"):
+            return  # not available on this platform
+        voice = voice.split("#")[0]
+        voices_dirs = self._settings["voices_directories"] + [self._settings["voices_download_dir"]]
+        for voices_dir in dict.fromkeys(voices_dirs):
+            voice_dir = join(voices_dir, voice)
+            if not isdir(voice_dir):
+                continue
+            for name in listdir(voice_dir):
+                path = join(voice_dir, name)
+                if not isfile(path):
+                    continue
+                try:
+                    fd = os.open(path, os.O_RDONLY)
+                    try:
+                        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                    finally:
+                        os.close(fd)
+                except OSError as e:
+                    LOG.debug(f"could not prefetch {path}: {e}")
+            return
+
+    def _preload_voice(self, voice: str):
+        if "#" in voice:
+            voice = voice.split("#")[0]
+        engine, lock = self._get_engine(voice)
+        with lock:
+            engine.preload_voice(voice)
+            if self._warmup:
+                # the first synthesis pays for onnxruntime session and
+                # allocator initialization, do it now instead of on a user request.
+                # a digit is read out by every phonemizer, unlike an english word
+                try:
+                    for _ in self._iter_audio(engine, "1"):
+                        pass
+                except Exception as e:
+                    # only an optimization, the voice is loaded already
+                    LOG.warning(f"mimic3 warmup failed for voice {voice}: {e}")
 
     def _validate_args_combo(self, lang=None, voice=None, speaker=None):
         # HACK: bug in some neon-core versions - neon_audio.tts.neon:_get_tts:198 - INFO - Legacy Neon TTS signature found 
@@ -105,11 +300,8 @@ class Mimic3TTSPlugin(TTS):
                     LOG.warning(f"speaker defined twice! choosing {new_speaker} over {speaker} for voice: {voice}")
                 speaker = new_speaker
         elif lang:
-            if lang not in self.default_voices:
-                lang = lang.split("-")[0]
-            if lang in self.default_voices:
-                voice = self.default_voices[lang]
-            else:
+            voice = self._resolve_voice(lang)
+            if not voice:
                 raise ValueError(f"Selected lang {lang} is not supported!")
         elif speaker and isinstance(speaker, str):
             pass  # TODO validate speaker is valid for default voice
@@ -142,27 +334,146 @@ class Mimic3TTSPlugin(TTS):
 
     def get_tts(self, sentence, wav_file, lang=None, voice=None, speaker=None):
         """Synthesize audio using Mimic3 on device"""
+        self._synth_to_file(sentence, wav_file, lang, voice, speaker)
+        return (wav_file, None)
+
+    def prefetch_tts(self, sentence, lang=None, voice=None, speaker=None) -> Future:
+        """Synthesize a sentence in the background, eg. the next line of a dialog
+        while the current one is playing
+
+        A later get_tts call for the same sentence is only served from memory
+        when the wav cache is enabled ("wav_cache_size" > 0), otherwise only the
+        returned future holds the audio
+
+        Returns:
+            Future: resolves to the WAV bytes
+        """
+        return self._prefetch_pool.submit(self._prefetch, sentence, lang, voice, speaker)
+
+    def shutdown(self):
+        # __del__ calls shutdown, __init__ may not have finished
+        pool = getattr(self, "_prefetch_pool", None)
+        if pool is not None:
+            pool.shutdown(wait=False)
+        super().shutdown()
+
+    def _prefetch(self, sentence, lang=None, voice=None, speaker=None) -> bytes:
+        # a directory instead of a NamedTemporaryFile, _mimic3_synth removes the
+        # file on failure and deleting it again would hide the synthesis error
+        with TemporaryDirectory() as tmp:
+            wav_file = join(tmp, "prefetch.wav")
+            wav_bytes = self._synth_to_file(sentence, wav_file, lang, voice, speaker)
+            if wav_bytes is None:
+                wav_bytes = Path(wav_file).read_bytes()
+        return wav_bytes
+
+    async def stream_tts(self, sentence, lang=None, voice=None, speaker=None) -> \
+            typing.AsyncIterator[bytes]:
+        """Yield audio while it is being synthesized, so playback can start
+        on the first chunk instead of waiting for the whole sentence
 
+        The first item is a WAV header (with unknown length), the following
+        items are raw PCM chunks
+        """
         voice, speaker, lang = self._validate_args_combo(lang, voice, speaker)
+        voice = voice or self.voice
+        sentence, ssml = self._apply_text_hacks(sentence)
+
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+        done = object()
+        # set when the consumer stops early (break, aclose, cancellation)
+        # so the engine lock and semaphore slot are released right away
+        stopped = Event()
+
+        def produce():
+            try:
+                engine, lock = self._get_engine(voice)
+                with lock, self._sem, _override_speaker(engine, speaker):
+                    if stopped.is_set():
+                        return  # consumer left while waiting for a busy voice
+                    for result in self._iter_audio(engine, sentence, ssml):
+                        if stopped.is_set():
+                            break
+                        loop.call_soon_threadsafe(queue.put_nowait, result)
+            except Exception as e:
+                loop.call_soon_threadsafe(queue.put_nowait, e)
+            finally:
+                loop.call_soon_threadsafe(queue.put_nowait, done)
+
+        producer = loop.run_in_executor(None, produce)
+        header_sent = False
+        try:
+            while True:
+                result = await queue.get()
+                if result is done:
+                    break
+                if isinstance(result, Exception):
+                    raise result
+                if not header_sent:
+                    yield _wav_header(result.sample_rate_hz, result.sample_width_bytes,
+                                      result.num_channels, _STREAM_DATA_SIZE)
+                    header_sent = True
+                yield _pcm_bytes(result)
+        finally:
+            stopped.set()
+        await producer
+
+    def _synth_to_file(self, sentence, wav_file, lang=None, voice=None, speaker=None) -> \
+            typing.Optional[bytes]:
+        """Synthesize sentence into wav_file
 
-        # support optional args for lang/voice/etc per request
-        # a lock is used because we modify internal self.tts state
-        with self.lock:
-            # self.tts.settings.length_scale = length_scale
-            # self.tts.settings.noise_scale = noise_scale
-            # self.tts.settings.noise_w = noise_w
+        Returns:
+            the WAV bytes if they were loaded in memory for the wav cache, else None
+        """
+        voice, speaker, lang = self._validate_args_combo(lang, voice, speaker)
+        voice = voice or self.voice
+        sentence, ssml = self._apply_text_hacks(sentence)
+
+        cache_key = self._cache_key(sentence, voice, speaker, ssml)
+        wav_bytes = self._cache_get(cache_key)
+        if wav_bytes is not None:
+            Path(wav_file).write_bytes(wav_bytes)
+            return wav_bytes
 
-            self.tts.voice = voice or self.tts.voice
-            self.tts.speaker = speaker or self.tts.speaker
-            # self.tts.language = lang or self.lang
+        # support optional args for lang/voice/etc per request
+        # each voice has a dedicated engine, the engine lock is held for the
+        # whole utterance since mimic3 keeps per utterance state in the engine.
+        # the semaphore is taken inside the engine lock so it only counts running
+        # syntheses, requests queued on a busy voice don't block idle voices
+        engine, lock = self._get_engine(voice)
+        with lock, self._sem, _override_speaker(engine, speaker):
+            self._mimic3_synth(engine, sentence, wav_file, ssml=ssml)
+
+        if self._wav_cache_size:
+            wav_bytes = Path(wav_file).read_bytes()
+            self._cache_put(cache_key, wav_bytes)
+        return wav_bytes
 
-            sentence, ssml = self._apply_text_hacks(sentence)
-            wav_bytes = self._mimic3_synth(sentence, ssml=ssml)
+    @property
+    def voices(self) -> list:
+        """mimic3 voices, both installed and downloadable, queried once"""
+        if self._voices is None:
+            self._voices = list(self.tts.get_voices())
+        return self._voices
 
-        # Write WAV to file
-        Path(wav_file).write_bytes(wav_bytes)
+    def get_voices(self, lang: str = None) -> list:
+        """Return the mimic3 voices for a lang, eg. "en-us" or just "en"
 
-        return (wav_file, None)
+        Returns:
+            list: mimic3_tts Voice objects, .key is the voice to pass to get_tts
+        """
+        if not lang:
+            return self.voices
+        lang = lang.lower().replace("_", "-")
+        voices = []
+        for voice in self.voices:
+            voice_lang = voice.language.lower().replace("_", "-")
+            if voice_lang == "en-uk":
+                voice_lang = "en-gb"  # mimic3 uses wrong lang code
+            if voice_lang == lang or voice_lang.split("-")[0] == lang:
+                voices.append(voice)
+        return voices
 
     @property
     def available_languages(self) -> set:
@@ -181,29 +492,32 @@ class Mimic3TTSPlugin(TTS):
         Returns: (text, ssml)
         """
 
+        # cheap C-level prefilters, most sentences are plain lowercase prose
+        # and never need the regexes below
+        # NOTE: islower() is False for strings without cased chars, that only
+        # means the regexes run when not strictly needed
+        has_upper = not sentence.islower()
+
         # HACK: Mycroft gives "eight a.m.next sentence" sometimes
-        sentence = sentence.replace(" a.m.", " a.m. ")
-        sentence = sentence.replace(" p.m.", " p.m. ")
+        if " a.m." in sentence or " p.m." in sentence:
+            sentence = _AMPM_RE.sub(r" \1.m. ", sentence)
 
         # A I -> A.I.
-        sentence = re.sub(
-            r"\b([A-Z](?: |$)){2,}",
-            lambda m: m.group(0).strip().replace(" ", ".") + ". ",
-            sentence,
-        )
+        if has_upper:
+            sentence = _ACRONYM_RE.sub(_acronym_repl, sentence)
 
         # Assume SSML if sentence begins with an angle bracket
-        ssml = sentence.strip().startswith("<")
+        # (match skips leading whitespace without building a stripped copy)
+        ssml = _SSML_RE.match(sentence) is not None
 
         # HACK: Speak single letters from Mycroft (e.g., "A;")
-        if (len(sentence) == 2) and sentence.endswith(";"):
+        if len(sentence) == 2 and sentence[1] == ";":
             letter = sentence[0]
             ssml = True
             sentence = f'<say-as interpret-as="spell-out">{letter}</say-as>'
-        else:
+        elif has_upper and "'" in sentence:
             # HACK: 'A' -> spell out
-            sentence, subs_made = re.subn(
-                r"'([A-Z])'",
+            sentence, subs_made = _SPELL_RE.subn(
                 r'<say-as interpret-as="spell-out">\1</say-as>',
                 sentence,
             )
@@ -212,733 +526,112 @@ class Mimic3TTSPlugin(TTS):
 
         return (sentence, ssml)
 
-    def _mimic3_synth(self, text: str, ssml: bool = False) -> bytes:
-        """Synthesize audio from text and return WAV bytes"""
-        with io.BytesIO() as wav_io:
-            wav_file: wave.Wave_write = wave.open(wav_io, "wb")
-            wav_params_set = False
-
-            with wav_file:
-                try:
-                    if ssml:
-                        # SSML
-                        results = SSMLSpeaker(self.tts).speak(text)
-                    else:
-                        # Plain text
-                        self.tts.begin_utterance()
-                        self.tts.speak_text(text)
-                        results = self.tts.end_utterance()
-
-                    for result in results:
-                        # Add audio to existing WAV file
-                        if isinstance(result, AudioResult):
-                            if not wav_params_set:
-                                wav_file.setframerate(result.sample_rate_hz)
-                                wav_file.setsampwidth(result.sample_width_bytes)
-                                wav_file.setnchannels(result.num_channels)
-                                wav_params_set = True
-
-                            wav_file.writeframes(result.audio_bytes)
-                except Exception as e:
+    @staticmethod
+    def _iter_audio(engine: Mimic3TextToSpeechSystem, text: str,
+                    ssml: bool = False) -> typing.Iterator[AudioResult]:
+        """Synthesize text with engine and yield the resulting audio chunks"""
+        if ssml:
+            # SSML
+            results = SSMLSpeaker(engine).speak(text)
+        else:
+            # Plain text
+            engine.begin_utterance()
+            engine.speak_text(text)
+            results = engine.end_utterance()
+
+        for result in results:
+            if isinstance(result, AudioResult):
+                yield result
+
+    def _mimic3_synth(self, engine: Mimic3TextToSpeechSystem, text: str,
+                      wav_file: str, ssml: bool = False):
+        """Synthesize audio from text, streaming WAV frames to wav_file"""
+        # defaults are only used if no audio is produced
+        rate, width, channels = 22050, 2, 1
+        wav_params_set = False
+        data_size = 0
+
+        try:
+            with open(wav_file, "wb", buffering=_WAV_BUFFER_SIZE) as f:
+                # leave room for the header, it is written once the data size is known
+                f.seek(_WAV_HEADER_SIZE)
+                write = f.write  # bound once, this runs for every chunk
+                for result in self._iter_audio(engine, text, ssml):
+                    # Add audio to existing WAV file
                     if not wav_params_set:
-                        # Set default parameters so exception can propagate
-                        wav_file.setframerate(22050)
-                        wav_file.setsampwidth(2)
-                        wav_file.setnchannels(1)
+                        rate = result.sample_rate_hz
+                        width = result.sample_width_bytes
+                        channels = result.num_channels
+                        wav_params_set = True
 
-                    raise e
+                    audio = _pcm_bytes(result)
+                    write(audio)
+                    data_size += len(audio)
 
-            wav_bytes = wav_io.getvalue()
+                f.seek(0)
+                f.write(_wav_header(rate, width, channels, data_size))
+        except Exception:
+            # don't leave a truncated wav behind for a failed synthesis
+            try:
+                os.unlink(wav_file)
+            except OSError:
+                pass
+            raise
 
-        return wav_bytes
 
+# data/voices/<lang>.json holds [voice, speaker, gender, priority] rows, they
+# are only loaded and expanded into the plugin config format when accessed
+# TODO manually check gender of each voice and fill it in the json files
+_VOICES_DIR = join(dirname(__file__), "data", "voices")
 
-# TODO manually check gender of each voice and add below
-Mimic3TTSPluginConfig = {
-    'af-za': [
-        {'speaker': '7214', 'voice': 'af_ZA/google-nwu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Nwu - 7214', 'gender': '', 'priority': 50}},
-        {'speaker': '8963', 'voice': 'af_ZA/google-nwu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Nwu - 8963', 'gender': '', 'priority': 50}},
-        {'speaker': '7130', 'voice': 'af_ZA/google-nwu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Nwu - 7130', 'gender': '', 'priority': 50}},
-        {'speaker': '8924', 'voice': 'af_ZA/google-nwu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Nwu - 8924', 'gender': '', 'priority': 50}},
-        {'speaker': '8148', 'voice': 'af_ZA/google-nwu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Nwu - 8148', 'gender': '', 'priority': 50}},
-        {'speaker': '1919', 'voice': 'af_ZA/google-nwu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Nwu - 1919', 'gender': '', 'priority': 50}},
-        {'speaker': '2418', 'voice': 'af_ZA/google-nwu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Nwu - 2418', 'gender': '', 'priority': 50}},
-        {'speaker': '6590', 'voice': 'af_ZA/google-nwu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Nwu - 6590', 'gender': '', 'priority': 50}},
-        {'speaker': '0184', 'voice': 'af_ZA/google-nwu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Nwu - 0184', 'gender': '', 'priority': 50}}],
-    'bn': [
-        {'speaker': 'rm', 'voice': 'bn/multi_low',
-         'meta': {'offline': True, 'display_name': 'Multi - Rm', 'gender': '', 'priority': 50}},
-        {'speaker': '03042', 'voice': 'bn/multi_low',
-         'meta': {'offline': True, 'display_name': 'Multi - 03042', 'gender': '', 'priority': 50}},
-        {'speaker': '00737', 'voice': 'bn/multi_low',
-         'meta': {'offline': True, 'display_name': 'Multi - 00737', 'gender': '', 'priority': 50}},
-        {'speaker': '01232', 'voice': 'bn/multi_low',
-         'meta': {'offline': True, 'display_name': 'Multi - 01232', 'gender': '', 'priority': 50}},
-        {'speaker': '02194', 'voice': 'bn/multi_low',
-         'meta': {'offline': True, 'display_name': 'Multi - 02194', 'gender': '', 'priority': 50}},
-        {'speaker': '3108', 'voice': 'bn/multi_low',
-         'meta': {'offline': True, 'display_name': 'Multi - 3108', 'gender': '', 'priority': 50}},
-        {'speaker': '3713', 'voice': 'bn/multi_low',
-         'meta': {'offline': True, 'display_name': 'Multi - 3713', 'gender': '', 'priority': 50}},
-        {'speaker': '1010', 'voice': 'bn/multi_low',
-         'meta': {'offline': True, 'display_name': 'Multi - 1010', 'gender': '', 'priority': 50}},
-        {'speaker': '00779', 'voice': 'bn/multi_low',
-         'meta': {'offline': True, 'display_name': 'Multi - 00779', 'gender': '', 'priority': 50}},
-        {'speaker': '9169', 'voice': 'bn/multi_low',
-         'meta': {'offline': True, 'display_name': 'Multi - 9169', 'gender': '', 'priority': 50}},
-        {'speaker': '4046', 'voice': 'bn/multi_low',
-         'meta': {'offline': True, 'display_name': 'Multi - 4046', 'gender': '', 'priority': 50}},
-        {'speaker': '5958', 'voice': 'bn/multi_low',
-         'meta': {'offline': True, 'display_name': 'Multi - 5958', 'gender': '', 'priority': 50}},
-        {'speaker': '01701', 'voice': 'bn/multi_low',
-         'meta': {'offline': True, 'display_name': 'Multi - 01701', 'gender': '', 'priority': 50}},
-        {'speaker': '4811', 'voice': 'bn/multi_low',
-         'meta': {'offline': True, 'display_name': 'Multi - 4811', 'gender': '', 'priority': 50}},
-        {'speaker': '0834', 'voice': 'bn/multi_low',
-         'meta': {'offline': True, 'display_name': 'Multi - 0834', 'gender': '', 'priority': 50}},
-        {'speaker': '3958', 'voice': 'bn/multi_low',
-         'meta': {'offline': True, 'display_name': 'Multi - 3958', 'gender': '', 'priority': 50}}],
-    'de-de': [
-        {'speaker': 'default', 'voice': 'de_DE/thorsten_low',
-         'meta': {'offline': True, 'display_name': 'Thorsten', 'gender': '', 'priority': 30}},
-        {'speaker': 'amused', 'voice': 'de_DE/thorsten-emotion_low',
-         'meta': {'offline': True, 'display_name': 'Thorsten-Emotion - Amused', 'gender': '', 'priority': 45}},
-        {'speaker': 'angry', 'voice': 'de_DE/thorsten-emotion_low',
-         'meta': {'offline': True, 'display_name': 'Thorsten-Emotion - Angry', 'gender': '', 'priority': 45}},
-        {'speaker': 'disgusted', 'voice': 'de_DE/thorsten-emotion_low',
-         'meta': {'offline': True, 'display_name': 'Thorsten-Emotion - Disgusted', 'gender': '', 'priority': 45}},
-        {'speaker': 'drunk', 'voice': 'de_DE/thorsten-emotion_low',
-         'meta': {'offline': True, 'display_name': 'Thorsten-Emotion - Drunk', 'gender': '', 'priority': 45}},
-        {'speaker': 'neutral', 'voice': 'de_DE/thorsten-emotion_low',
-         'meta': {'offline': True, 'display_name': 'Thorsten-Emotion - Neutral', 'gender': '', 'priority': 45}},
-        {'speaker': 'sleepy', 'voice': 'de_DE/thorsten-emotion_low',
-         'meta': {'offline': True, 'display_name': 'Thorsten-Emotion - Sleepy', 'gender': '', 'priority': 45}},
-        {'speaker': 'surprised', 'voice': 'de_DE/thorsten-emotion_low',
-         'meta': {'offline': True, 'display_name': 'Thorsten-Emotion - Surprised', 'gender': '', 'priority': 45}},
-        {'speaker': 'whisper', 'voice': 'de_DE/thorsten-emotion_low',
-         'meta': {'offline': True, 'display_name': 'Thorsten-Emotion - Whisper', 'gender': '', 'priority': 45}},
-        {'speaker': 'ramona_deininger', 'voice': 'de_DE/m-ailabs_low',
-         'meta': {'offline': True, 'display_name': 'M-Ailabs - Ramona Deininger', 'gender': '', 'priority': 31}},
-        {'speaker': 'karlsson', 'voice': 'de_DE/m-ailabs_low',
-         'meta': {'offline': True, 'display_name': 'M-Ailabs - Karlsson', 'priority': 31, 'gender': ''}},
-        {'speaker': 'rebecca_braunert_plunkett', 'voice': 'de_DE/m-ailabs_low',
-         'meta': {'offline': True, 'display_name': 'M-Ailabs - Rebecca Braunert Plunkett', 'priority': 31,
-                  'gender': ''}},
-        {'speaker': 'eva_k', 'voice': 'de_DE/m-ailabs_low',
-         'meta': {'offline': True, 'display_name': 'M-Ailabs - Eva K', 'priority': 31, 'gender': ''}},
-        {'speaker': 'angela_merkel', 'voice': 'de_DE/m-ailabs_low',
-         'meta': {'offline': True, 'display_name': 'M-Ailabs - Angela Merkel', 'priority': 31, 'gender': ''}}],
-    'el-gr': [
-        {'speaker': 'default', 'voice': 'el_GR/rapunzelina_low',
-         'meta': {'offline': True, 'display_name': 'Rapunzelina', 'priority': 40, 'gender': ''}}],
-    'en-gb': [
-        {'speaker': 'default', 'voice': 'en_UK/apope_low',
-         'meta': {'offline': True, 'display_name': 'Apope', 'priority': 30, 'gender': 'male'}}],
-    'en-us': [
-        {'speaker': 'slt', 'voice': 'en_US/cmu-arctic_low',
-         'meta': {'offline': True, 'display_name': 'Cmu-Arctic - Slt', 'gender': 'female', 'priority': 40}},
-        {'speaker': 'awb', 'voice': 'en_US/cmu-arctic_low',
-         'meta': {'offline': True, 'display_name': 'Cmu-Arctic - Awb', 'gender': 'male', 'priority': 40}},
-        {'speaker': 'rms', 'voice': 'en_US/cmu-arctic_low',
-         'meta': {'offline': True, 'display_name': 'Cmu-Arctic - Rms', 'gender': 'male', 'priority': 40}},
-        {'speaker': 'ksp', 'voice': 'en_US/cmu-arctic_low',
-         'meta': {'offline': True, 'display_name': 'Cmu-Arctic - Ksp', 'gender': 'male', 'priority': 40}},
-        {'speaker': 'clb', 'voice': 'en_US/cmu-arctic_low',
-         'meta': {'offline': True, 'display_name': 'Cmu-Arctic - Clb', 'gender': 'female', 'priority': 40}},
-        {'speaker': 'aew', 'voice': 'en_US/cmu-arctic_low',
-         'meta': {'offline': True, 'display_name': 'Cmu-Arctic - Aew', 'gender': 'male', 'priority': 40}},
-        {'speaker': 'bdl', 'voice': 'en_US/cmu-arctic_low',
-         'meta': {'offline': True, 'display_name': 'Cmu-Arctic - Bdl', 'gender': 'male', 'priority': 40}},
-        {'speaker': 'lnh', 'voice': 'en_US/cmu-arctic_low',
-         'meta': {'offline': True, 'display_name': 'Cmu-Arctic - Lnh', 'gender': 'female', 'priority': 40}},
-        {'speaker': '9017', 'voice': 'en_US/hifi-tts_low',
-         'meta': {'offline': True, 'display_name': 'Hifi-Tts - 9017', 'gender': 'male', 'priority': 40}},
-        {'speaker': '6097', 'voice': 'en_US/hifi-tts_low',
-         'meta': {'offline': True, 'display_name': 'Hifi-Tts - 6097', 'gender': 'male', 'priority': 40}},
-        {'speaker': '92', 'voice': 'en_US/hifi-tts_low',
-         'meta': {'offline': True, 'display_name': 'Hifi-Tts - 92', 'gender': 'female', 'priority': 40}},
-        {'speaker': 'default', 'voice': 'en_US/ljspeech_low',
-         'meta': {'offline': True, 'display_name': 'Ljspeech', 'gender': 'female', 'priority': 45}},
-        {'speaker': 'elliot_miller', 'voice': 'en_US/m-ailabs_low',
-         'meta': {'offline': True, 'display_name': 'M-Ailabs - Elliot Miller', 'gender': 'male', 'priority': 40}},
-        {'speaker': 'judy_bieber', 'voice': 'en_US/m-ailabs_low',
-         'meta': {'offline': True, 'display_name': 'M-Ailabs - Judy Bieber', 'gender': 'female', 'priority': 40}},
-        {'speaker': 'mary_ann', 'voice': 'en_US/m-ailabs_low',
-         'meta': {'offline': True, 'display_name': 'M-Ailabs - Mary Ann', 'gender': 'female', 'priority': 45}},
-        {'speaker': 'p239', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P239', 'gender': '', 'priority': 41}},
-        {'speaker': 'p236', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P236', 'gender': '', 'priority': 41}},
-        {'speaker': 'p264', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P264', 'gender': '', 'priority': 41}},
-        {'speaker': 'p250', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P250', 'gender': '', 'priority': 41}},
-        {'speaker': 'p259', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P259', 'gender': '', 'priority': 41}},
-        {'speaker': 'p247', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P247', 'gender': '', 'priority': 41}},
-        {'speaker': 'p261', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P261', 'gender': '', 'priority': 41}},
-        {'speaker': 'p263', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P263', 'gender': '', 'priority': 41}},
-        {'speaker': 'p283', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P283', 'gender': '', 'priority': 41}},
-        {'speaker': 'p274', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P274', 'gender': '', 'priority': 41}},
-        {'speaker': 'p286', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P286', 'gender': '', 'priority': 41}},
-        {'speaker': 'p276', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P276', 'gender': '', 'priority': 41}},
-        {'speaker': 'p270', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P270', 'gender': '', 'priority': 41}},
-        {'speaker': 'p281', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P281', 'gender': '', 'priority': 41}},
-        {'speaker': 'p277', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P277', 'gender': '', 'priority': 41}},
-        {'speaker': 'p231', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P231', 'gender': '', 'priority': 41}},
-        {'speaker': 'p238', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P238', 'gender': '', 'priority': 41}},
-        {'speaker': 'p271', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P271', 'gender': '', 'priority': 41}},
-        {'speaker': 'p257', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P257', 'gender': '', 'priority': 41}},
-        {'speaker': 'p273', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P273', 'gender': '', 'priority': 41}},
-        {'speaker': 'p284', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P284', 'gender': '', 'priority': 41}},
-        {'speaker': 'p329', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P329', 'gender': '', 'priority': 41}},
-        {'speaker': 'p361', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P361', 'gender': '', 'priority': 41}},
-        {'speaker': 'p287', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P287', 'gender': '', 'priority': 41}},
-        {'speaker': 'p360', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P360', 'gender': '', 'priority': 41}},
-        {'speaker': 'p374', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P374', 'gender': '', 'priority': 41}},
-        {'speaker': 'p376', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P376', 'gender': '', 'priority': 41}},
-        {'speaker': 'p310', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P310', 'gender': '', 'priority': 41}},
-        {'speaker': 'p304', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P304', 'gender': '', 'priority': 41}},
-        {'speaker': 'p340', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P340', 'gender': '', 'priority': 41}},
-        {'speaker': 'p347', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P347', 'gender': '', 'priority': 41}},
-        {'speaker': 'p330', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P330', 'gender': '', 'priority': 41}},
-        {'speaker': 'p308', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P308', 'gender': '', 'priority': 41}},
-        {'speaker': 'p314', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P314', 'gender': '', 'priority': 41}},
-        {'speaker': 'p317', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P317', 'gender': '', 'priority': 41}},
-        {'speaker': 'p339', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P339', 'gender': '', 'priority': 41}},
-        {'speaker': 'p311', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P311', 'gender': '', 'priority': 41}},
-        {'speaker': 'p294', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P294', 'gender': '', 'priority': 41}},
-        {'speaker': 'p305', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P305', 'gender': '', 'priority': 41}},
-        {'speaker': 'p266', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P266', 'gender': '', 'priority': 41}},
-        {'speaker': 'p335', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P335', 'gender': '', 'priority': 41}},
-        {'speaker': 'p334', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P334', 'gender': '', 'priority': 41}},
-        {'speaker': 'p318', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P318', 'gender': '', 'priority': 41}},
-        {'speaker': 'p323', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P323', 'gender': '', 'priority': 41}},
-        {'speaker': 'p351', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P351', 'gender': '', 'priority': 41}},
-        {'speaker': 'p333', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P333', 'gender': '', 'priority': 41}},
-        {'speaker': 'p313', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P313', 'gender': '', 'priority': 41}},
-        {'speaker': 'p316', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P316', 'gender': '', 'priority': 41}},
-        {'speaker': 'p244', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P244', 'gender': '', 'priority': 41}},
-        {'speaker': 'p307', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P307', 'gender': '', 'priority': 41}},
-        {'speaker': 'p363', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P363', 'gender': '', 'priority': 41}},
-        {'speaker': 'p336', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P336', 'gender': '', 'priority': 41}},
-        {'speaker': 'p312', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P312', 'gender': '', 'priority': 41}},
-        {'speaker': 'p267', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P267', 'gender': '', 'priority': 41}},
-        {'speaker': 'p297', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P297', 'gender': '', 'priority': 41}},
-        {'speaker': 'p275', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P275', 'gender': '', 'priority': 41}},
-        {'speaker': 'p295', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P295', 'gender': '', 'priority': 41}},
-        {'speaker': 'p288', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P288', 'gender': '', 'priority': 41}},
-        {'speaker': 'p258', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P258', 'gender': '', 'priority': 41}},
-        {'speaker': 'p301', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P301', 'gender': '', 'priority': 41}},
-        {'speaker': 'p232', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P232', 'gender': '', 'priority': 41}},
-        {'speaker': 'p292', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P292', 'gender': '', 'priority': 41}},
-        {'speaker': 'p272', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P272', 'gender': '', 'priority': 41}},
-        {'speaker': 'p278', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P278', 'gender': '', 'priority': 41}},
-        {'speaker': 'p280', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P280', 'gender': '', 'priority': 41}},
-        {'speaker': 'p341', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P341', 'gender': '', 'priority': 41}},
-        {'speaker': 'p268', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P268', 'gender': '', 'priority': 41}},
-        {'speaker': 'p298', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P298', 'gender': '', 'priority': 41}},
-        {'speaker': 'p299', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P299', 'gender': '', 'priority': 41}},
-        {'speaker': 'p279', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P279', 'gender': '', 'priority': 41}},
-        {'speaker': 'p285', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P285', 'gender': '', 'priority': 41}},
-        {'speaker': 'p326', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P326', 'gender': '', 'priority': 41}},
-        {'speaker': 'p300', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P300', 'gender': '', 'priority': 41}},
-        {'speaker': 's5', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - S5', 'gender': '', 'priority': 41}},
-        {'speaker': 'p230', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P230', 'gender': '', 'priority': 41}},
-        {'speaker': 'p254', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P254', 'gender': '', 'priority': 41}},
-        {'speaker': 'p269', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P269', 'gender': '', 'priority': 41}},
-        {'speaker': 'p293', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P293', 'gender': '', 'priority': 41}},
-        {'speaker': 'p252', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P252', 'gender': '', 'priority': 41}},
-        {'speaker': 'p345', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P345', 'gender': '', 'priority': 41}},
-        {'speaker': 'p262', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P262', 'gender': '', 'priority': 41}},
-        {'speaker': 'p243', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P243', 'gender': '', 'priority': 41}},
-        {'speaker': 'p227', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P227', 'gender': '', 'priority': 41}},
-        {'speaker': 'p343', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P343', 'gender': '', 'priority': 41}},
-        {'speaker': 'p255', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P255', 'gender': '', 'priority': 41}},
-        {'speaker': 'p229', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P229', 'gender': '', 'priority': 41}},
-        {'speaker': 'p240', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P240', 'gender': '', 'priority': 41}},
-        {'speaker': 'p248', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P248', 'gender': '', 'priority': 41}},
-        {'speaker': 'p253', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P253', 'gender': '', 'priority': 41}},
-        {'speaker': 'p233', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P233', 'gender': '', 'priority': 41}},
-        {'speaker': 'p228', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P228', 'gender': '', 'priority': 41}},
-        {'speaker': 'p251', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P251', 'gender': '', 'priority': 41}},
-        {'speaker': 'p282', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P282', 'gender': '', 'priority': 41}},
-        {'speaker': 'p246', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P246', 'gender': '', 'priority': 41}},
-        {'speaker': 'p234', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P234', 'gender': '', 'priority': 41}},
-        {'speaker': 'p226', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P226', 'gender': '', 'priority': 41}},
-        {'speaker': 'p260', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P260', 'gender': '', 'priority': 41}},
-        {'speaker': 'p245', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P245', 'gender': '', 'priority': 41}},
-        {'speaker': 'p241', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P241', 'gender': '', 'priority': 41}},
-        {'speaker': 'p303', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P303', 'gender': '', 'priority': 41}},
-        {'speaker': 'p265', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P265', 'gender': '', 'priority': 41}},
-        {'speaker': 'p306', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P306', 'gender': '', 'priority': 41}},
-        {'speaker': 'p237', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P237', 'gender': '', 'priority': 41}},
-        {'speaker': 'p249', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P249', 'gender': '', 'priority': 41}},
-        {'speaker': 'p256', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P256', 'gender': '', 'priority': 41}},
-        {'speaker': 'p302', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P302', 'gender': '', 'priority': 41}},
-        {'speaker': 'p364', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P364', 'gender': '', 'priority': 41}},
-        {'speaker': 'p225', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P225', 'gender': '', 'priority': 41}},
-        {'speaker': 'p362', 'voice': 'en_US/vctk_low',
-         'meta': {'offline': True, 'display_name': 'Vctk - P362', 'gender': '', 'priority': 41}}],
-    'es-es': [
-        {'speaker': 'default', 'voice': 'es_ES/carlfm_low',
-         'meta': {'offline': True, 'display_name': 'Carlfm', 'gender': '', 'priority': 40}},
-        {'speaker': 'tux', 'voice': 'es_ES/m-ailabs_low',
-         'meta': {'offline': True, 'display_name': 'M-Ailabs - Tux', 'gender': '', 'priority': 40}},
-        {'speaker': 'victor_villarraza', 'voice': 'es_ES/m-ailabs_low',
-         'meta': {'offline': True, 'display_name': 'M-Ailabs - Victor Villarraza', 'gender': '', 'priority': 40}},
-        {'speaker': 'karen_savage', 'voice': 'es_ES/m-ailabs_low',
-         'meta': {'offline': True, 'display_name': 'M-Ailabs - Karen Savage', 'gender': '', 'priority': 40}}],
-    'fa': [
-        {'speaker': 'default', 'voice': 'fa/haaniye_low',
-         'meta': {'offline': True, 'display_name': 'Haaniye', 'gender': '', 'priority': 50}}],
-    'fi-fi': [
-        {'speaker': 'default', 'voice': 'fi_FI/harri-tapani-ylilammi_low',
-         'meta': {'offline': True, 'display_name': 'Harri-Tapani-Ylilammi', 'gender': '', 'priority': 50}}],
-    'fr-fr': [
-        {'speaker': 'ezwa', 'voice': 'fr_FR/m-ailabs_low',
-         'meta': {'offline': True, 'display_name': 'M-Ailabs - Ezwa', 'gender': '', 'priority': 40}},
-        {'speaker': 'nadine_eckert_boulet', 'voice': 'fr_FR/m-ailabs_low',
-         'meta': {'offline': True, 'display_name': 'M-Ailabs - Nadine Eckert Boulet', 'gender': '', 'priority': 40}},
-        {'speaker': 'bernard', 'voice': 'fr_FR/m-ailabs_low',
-         'meta': {'offline': True, 'display_name': 'M-Ailabs - Bernard', 'gender': '', 'priority': 40}},
-        {'speaker': 'zeckou', 'voice': 'fr_FR/m-ailabs_low',
-         'meta': {'offline': True, 'display_name': 'M-Ailabs - Zeckou', 'gender': '', 'priority': 40}},
-        {'speaker': 'gilles_g_le_blanc', 'voice': 'fr_FR/m-ailabs_low',
-         'meta': {'offline': True, 'display_name': 'M-Ailabs - Gilles G Le Blanc', 'gender': '', 'priority': 40}},
-        {'speaker': 'default', 'voice': 'fr_FR/siwis_low',
-         'meta': {'offline': True, 'display_name': 'Siwis', 'gender': '', 'priority': 40}},
-        {'speaker': 'default', 'voice': 'fr_FR/tom_low',
-         'meta': {'offline': True, 'display_name': 'Tom', 'gender': '', 'priority': 40}}],
-    'gu-in': [
-        {'speaker': 'cmu_indic_guj_dp', 'voice': 'gu_IN/cmu-indic_low',
-         'meta': {'offline': True, 'display_name': 'Cmu-Indic - Cmu Indic Guj Dp', 'gender': '', 'priority': 50}},
-        {'speaker': 'cmu_indic_guj_ad', 'voice': 'gu_IN/cmu-indic_low',
-         'meta': {'offline': True, 'display_name': 'Cmu-Indic - Cmu Indic Guj Ad', 'gender': '', 'priority': 50}},
-        {'speaker': 'cmu_indic_guj_kt', 'voice': 'gu_IN/cmu-indic_low',
-         'meta': {'offline': True, 'display_name': 'Cmu-Indic - Cmu Indic Guj Kt', 'gender': '', 'priority': 50}}],
-    'ha-ne': [{'speaker': 'default', 'voice': 'ha_NE/openbible_low',
-               'meta': {'offline': True, 'display_name': 'Openbible', 'gender': '', 'priority': 50}}],
-    'hu-hu': [
-        {'speaker': 'default', 'voice': 'hu_HU/diana-majlinger_low',
-         'meta': {'offline': True, 'display_name': 'Diana-Majlinger', 'gender': '', 'priority': 50}}],
-    'it-it': [
-        {'speaker': 'default', 'voice': 'it_IT/riccardo-fasol_low',
-         'meta': {'offline': True, 'display_name': 'Riccardo-Fasol', 'gender': '', 'priority': 40}},
-        {'speaker': '1595', 'voice': 'it_IT/mls_low',
-         'meta': {'offline': True, 'display_name': 'Mls - 1595', 'gender': '', 'priority': 50}},
-        {'speaker': '4974', 'voice': 'it_IT/mls_low',
-         'meta': {'offline': True, 'display_name': 'Mls - 4974', 'gender': '', 'priority': 50}},
-        {'speaker': '4998', 'voice': 'it_IT/mls_low',
-         'meta': {'offline': True, 'display_name': 'Mls - 4998', 'gender': '', 'priority': 50}},
-        {'speaker': '6807', 'voice': 'it_IT/mls_low',
-         'meta': {'offline': True, 'display_name': 'Mls - 6807', 'gender': '', 'priority': 50}},
-        {'speaker': '1989', 'voice': 'it_IT/mls_low',
-         'meta': {'offline': True, 'display_name': 'Mls - 1989', 'gender': '', 'priority': 50}},
-        {'speaker': '2033', 'voice': 'it_IT/mls_low',
-         'meta': {'offline': True, 'display_name': 'Mls - 2033', 'gender': '', 'priority': 50}},
-        {'speaker': '2019', 'voice': 'it_IT/mls_low',
-         'meta': {'offline': True, 'display_name': 'Mls - 2019', 'gender': '', 'priority': 50}},
-        {'speaker': '659', 'voice': 'it_IT/mls_low',
-         'meta': {'offline': True, 'display_name': 'Mls - 659', 'gender': '', 'priority': 50}},
-        {'speaker': '4649', 'voice': 'it_IT/mls_low',
-         'meta': {'offline': True, 'display_name': 'Mls - 4649', 'gender': '', 'priority': 50}},
-        {'speaker': '9772', 'voice': 'it_IT/mls_low',
-         'meta': {'offline': True, 'display_name': 'Mls - 9772', 'gender': '', 'priority': 50}},
-        {'speaker': '1725', 'voice': 'it_IT/mls_low',
-         'meta': {'offline': True, 'display_name': 'Mls - 1725', 'gender': '', 'priority': 50}},
-        {'speaker': '10446', 'voice': 'it_IT/mls_low',
-         'meta': {'offline': True, 'display_name': 'Mls - 10446', 'gender': '', 'priority': 50}},
-        {'speaker': '6348', 'voice': 'it_IT/mls_low',
-         'meta': {'offline': True, 'display_name': 'Mls - 6348', 'gender': '', 'priority': 50}},
-        {'speaker': '6001', 'voice': 'it_IT/mls_low',
-         'meta': {'offline': True, 'display_name': 'Mls - 6001', 'gender': '', 'priority': 50}},
-        {'speaker': '9185', 'voice': 'it_IT/mls_low',
-         'meta': {'offline': True, 'display_name': 'Mls - 9185', 'gender': '', 'priority': 50}},
-        {'speaker': '8842', 'voice': 'it_IT/mls_low',
-         'meta': {'offline': True, 'display_name': 'Mls - 8842', 'gender': '', 'priority': 50}},
-        {'speaker': '8828', 'voice': 'it_IT/mls_low',
-         'meta': {'offline': True, 'display_name': 'Mls - 8828', 'gender': '', 'priority': 50}},
-        {'speaker': '12428', 'voice': 'it_IT/mls_low',
-         'meta': {'offline': True, 'display_name': 'Mls - 12428', 'gender': '', 'priority': 50}},
-        {'speaker': '8181', 'voice': 'it_IT/mls_low',
-         'meta': {'offline': True, 'display_name': 'Mls - 8181', 'gender': '', 'priority': 50}},
-        {'speaker': '7440', 'voice': 'it_IT/mls_low',
-         'meta': {'offline': True, 'display_name': 'Mls - 7440', 'gender': '', 'priority': 50}},
-        {'speaker': '8207', 'voice': 'it_IT/mls_low',
-         'meta': {'offline': True, 'display_name': 'Mls - 8207', 'gender': '', 'priority': 50}},
-        {'speaker': '277', 'voice': 'it_IT/mls_low',
-         'meta': {'offline': True, 'display_name': 'Mls - 277', 'gender': '', 'priority': 50}},
-        {'speaker': '5421', 'voice': 'it_IT/mls_low',
-         'meta': {'offline': True, 'display_name': 'Mls - 5421', 'gender': '', 'priority': 50}},
-        {'speaker': '12804', 'voice': 'it_IT/mls_low',
-         'meta': {'offline': True, 'display_name': 'Mls - 12804', 'gender': '', 'priority': 50}},
-        {'speaker': '4705', 'voice': 'it_IT/mls_low',
-         'meta': {'offline': True, 'display_name': 'Mls - 4705', 'gender': '', 'priority': 50}},
-        {'speaker': '7936', 'voice': 'it_IT/mls_low',
-         'meta': {'offline': True, 'display_name': 'Mls - 7936', 'gender': '', 'priority': 50}},
-        {'speaker': '844', 'voice': 'it_IT/mls_low',
-         'meta': {'offline': True, 'display_name': 'Mls - 844', 'gender': '', 'priority': 50}},
-        {'speaker': '6299', 'voice': 'it_IT/mls_low',
-         'meta': {'offline': True, 'display_name': 'Mls - 6299', 'gender': '', 'priority': 50}},
-        {'speaker': '644', 'voice': 'it_IT/mls_low',
-         'meta': {'offline': True, 'display_name': 'Mls - 644', 'gender': '', 'priority': 50}},
-        {'speaker': '8384', 'voice': 'it_IT/mls_low',
-         'meta': {'offline': True, 'display_name': 'Mls - 8384', 'gender': '', 'priority': 50}},
-        {'speaker': '1157', 'voice': 'it_IT/mls_low',
-         'meta': {'offline': True, 'display_name': 'Mls - 1157', 'gender': '', 'priority': 50}},
-        {'speaker': '7444', 'voice': 'it_IT/mls_low',
-         'meta': {'offline': True, 'display_name': 'Mls - 7444', 'gender': '', 'priority': 50}},
-        {'speaker': '643', 'voice': 'it_IT/mls_low',
-         'meta': {'offline': True, 'display_name': 'Mls - 643', 'gender': '', 'priority': 50}},
-        {'speaker': '4971', 'voice': 'it_IT/mls_low',
-         'meta': {'offline': True, 'display_name': 'Mls - 4971', 'gender': '', 'priority': 50}},
-        {'speaker': '4975', 'voice': 'it_IT/mls_low',
-         'meta': {'offline': True, 'display_name': 'Mls - 4975', 'gender': '', 'priority': 50}},
-        {'speaker': '6744', 'voice': 'it_IT/mls_low',
-         'meta': {'offline': True, 'display_name': 'Mls - 6744', 'gender': '', 'priority': 50}},
-        {'speaker': '8461', 'voice': 'it_IT/mls_low',
-         'meta': {'offline': True, 'display_name': 'Mls - 8461', 'gender': '', 'priority': 50}},
-        {'speaker': '7405', 'voice': 'it_IT/mls_low',
-         'meta': {'offline': True, 'display_name': 'Mls - 7405', 'gender': '', 'priority': 50}},
-        {'speaker': '5010', 'voice': 'it_IT/mls_low',
-         'meta': {'offline': True, 'display_name': 'Mls - 5010', 'gender': '', 'priority': 50}}],
-    'jv-id': [
-        {'speaker': '07875', 'voice': 'jv_ID/google-gmu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Gmu - 07875', 'gender': '', 'priority': 50}},
-        {'speaker': '05522', 'voice': 'jv_ID/google-gmu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Gmu - 05522', 'gender': '', 'priority': 50}},
-        {'speaker': '03424', 'voice': 'jv_ID/google-gmu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Gmu - 03424', 'gender': '', 'priority': 50}},
-        {'speaker': '06510', 'voice': 'jv_ID/google-gmu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Gmu - 06510', 'gender': '', 'priority': 50}},
-        {'speaker': '03314', 'voice': 'jv_ID/google-gmu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Gmu - 03314', 'gender': '', 'priority': 50}},
-        {'speaker': '03187', 'voice': 'jv_ID/google-gmu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Gmu - 03187', 'gender': '', 'priority': 50}},
-        {'speaker': '07638', 'voice': 'jv_ID/google-gmu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Gmu - 07638', 'gender': '', 'priority': 50}},
-        {'speaker': '06207', 'voice': 'jv_ID/google-gmu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Gmu - 06207', 'gender': '', 'priority': 50}},
-        {'speaker': '08736', 'voice': 'jv_ID/google-gmu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Gmu - 08736', 'gender': '', 'priority': 50}},
-        {'speaker': '04679', 'voice': 'jv_ID/google-gmu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Gmu - 04679', 'gender': '', 'priority': 50}},
-        {'speaker': '01392', 'voice': 'jv_ID/google-gmu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Gmu - 01392', 'gender': '', 'priority': 50}},
-        {'speaker': '05540', 'voice': 'jv_ID/google-gmu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Gmu - 05540', 'gender': '', 'priority': 50}},
-        {'speaker': '05219', 'voice': 'jv_ID/google-gmu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Gmu - 05219', 'gender': '', 'priority': 50}},
-        {'speaker': '00027', 'voice': 'jv_ID/google-gmu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Gmu - 00027', 'gender': '', 'priority': 50}},
-        {'speaker': '00264', 'voice': 'jv_ID/google-gmu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Gmu - 00264', 'gender': '', 'priority': 50}},
-        {'speaker': '09724', 'voice': 'jv_ID/google-gmu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Gmu - 09724', 'gender': '', 'priority': 50}},
-        {'speaker': '04588', 'voice': 'jv_ID/google-gmu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Gmu - 04588', 'gender': '', 'priority': 50}},
-        {'speaker': '09039', 'voice': 'jv_ID/google-gmu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Gmu - 09039', 'gender': '', 'priority': 50}},
-        {'speaker': '04285', 'voice': 'jv_ID/google-gmu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Gmu - 04285', 'gender': '', 'priority': 50}},
-        {'speaker': '05970', 'voice': 'jv_ID/google-gmu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Gmu - 05970', 'gender': '', 'priority': 50}},
-        {'speaker': '08305', 'voice': 'jv_ID/google-gmu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Gmu - 08305', 'gender': '', 'priority': 50}},
-        {'speaker': '04982', 'voice': 'jv_ID/google-gmu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Gmu - 04982', 'gender': '', 'priority': 50}},
-        {'speaker': '08002', 'voice': 'jv_ID/google-gmu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Gmu - 08002', 'gender': '', 'priority': 50}},
-        {'speaker': '06080', 'voice': 'jv_ID/google-gmu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Gmu - 06080', 'gender': '', 'priority': 50}},
-        {'speaker': '07765', 'voice': 'jv_ID/google-gmu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Gmu - 07765', 'gender': '', 'priority': 50}},
-        {'speaker': '02326', 'voice': 'jv_ID/google-gmu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Gmu - 02326', 'gender': '', 'priority': 50}},
-        {'speaker': '03727', 'voice': 'jv_ID/google-gmu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Gmu - 03727', 'gender': '', 'priority': 50}},
-        {'speaker': '04175', 'voice': 'jv_ID/google-gmu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Gmu - 04175', 'gender': '', 'priority': 50}},
-        {'speaker': '06383', 'voice': 'jv_ID/google-gmu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Gmu - 06383', 'gender': '', 'priority': 50}},
-        {'speaker': '02884', 'voice': 'jv_ID/google-gmu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Gmu - 02884', 'gender': '', 'priority': 50}},
-        {'speaker': '06941', 'voice': 'jv_ID/google-gmu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Gmu - 06941', 'gender': '', 'priority': 50}},
-        {'speaker': '08178', 'voice': 'jv_ID/google-gmu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Gmu - 08178', 'gender': '', 'priority': 50}},
-        {'speaker': '00658', 'voice': 'jv_ID/google-gmu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Gmu - 00658', 'gender': '', 'priority': 50}},
-        {'speaker': '04715', 'voice': 'jv_ID/google-gmu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Gmu - 04715', 'gender': '', 'priority': 50}},
-        {'speaker': '05667', 'voice': 'jv_ID/google-gmu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Gmu - 05667', 'gender': '', 'priority': 50}},
-        {'speaker': '01519', 'voice': 'jv_ID/google-gmu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Gmu - 01519', 'gender': '', 'priority': 50}},
-        {'speaker': '07335', 'voice': 'jv_ID/google-gmu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Gmu - 07335', 'gender': '', 'priority': 50}},
-        {'speaker': '02059', 'voice': 'jv_ID/google-gmu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Gmu - 02059', 'gender': '', 'priority': 50}},
-        {'speaker': '01932', 'voice': 'jv_ID/google-gmu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Gmu - 01932', 'gender': '', 'priority': 50}}],
-    'ko-ko': [
-        {'speaker': 'default', 'voice': 'ko_KO/kss_low',
-         'meta': {'offline': True, 'display_name': 'Kss', 'gender': '', 'priority': 50}}],
-    'ne-np': [
-        {'speaker': '0546', 'voice': 'ne_NP/ne-google_low',
-         'meta': {'offline': True, 'display_name': 'Ne-Google - 0546', 'gender': '', 'priority': 50}},
-        {'speaker': '3614', 'voice': 'ne_NP/ne-google_low',
-         'meta': {'offline': True, 'display_name': 'Ne-Google - 3614', 'gender': '', 'priority': 50}},
-        {'speaker': '2099', 'voice': 'ne_NP/ne-google_low',
-         'meta': {'offline': True, 'display_name': 'Ne-Google - 2099', 'gender': '', 'priority': 50}},
-        {'speaker': '3960', 'voice': 'ne_NP/ne-google_low',
-         'meta': {'offline': True, 'display_name': 'Ne-Google - 3960', 'gender': '', 'priority': 50}},
-        {'speaker': '6834', 'voice': 'ne_NP/ne-google_low',
-         'meta': {'offline': True, 'display_name': 'Ne-Google - 6834', 'gender': '', 'priority': 50}},
-        {'speaker': '7957', 'voice': 'ne_NP/ne-google_low',
-         'meta': {'offline': True, 'display_name': 'Ne-Google - 7957', 'gender': '', 'priority': 50}},
-        {'speaker': '6329', 'voice': 'ne_NP/ne-google_low',
-         'meta': {'offline': True, 'display_name': 'Ne-Google - 6329', 'gender': '', 'priority': 50}},
-        {'speaker': '9407', 'voice': 'ne_NP/ne-google_low',
-         'meta': {'offline': True, 'display_name': 'Ne-Google - 9407', 'gender': '', 'priority': 50}},
-        {'speaker': '6587', 'voice': 'ne_NP/ne-google_low',
-         'meta': {'offline': True, 'display_name': 'Ne-Google - 6587', 'gender': '', 'priority': 50}},
-        {'speaker': '0258', 'voice': 'ne_NP/ne-google_low',
-         'meta': {'offline': True, 'display_name': 'Ne-Google - 0258', 'gender': '', 'priority': 50}},
-        {'speaker': '2139', 'voice': 'ne_NP/ne-google_low',
-         'meta': {'offline': True, 'display_name': 'Ne-Google - 2139', 'gender': '', 'priority': 50}},
-        {'speaker': '5687', 'voice': 'ne_NP/ne-google_low',
-         'meta': {'offline': True, 'display_name': 'Ne-Google - 5687', 'gender': '', 'priority': 50}},
-        {'speaker': '0283', 'voice': 'ne_NP/ne-google_low',
-         'meta': {'offline': True, 'display_name': 'Ne-Google - 0283', 'gender': '', 'priority': 50}},
-        {'speaker': '3997', 'voice': 'ne_NP/ne-google_low',
-         'meta': {'offline': True, 'display_name': 'Ne-Google - 3997', 'gender': '', 'priority': 50}},
-        {'speaker': '3154', 'voice': 'ne_NP/ne-google_low',
-         'meta': {'offline': True, 'display_name': 'Ne-Google - 3154', 'gender': '', 'priority': 50}},
-        {'speaker': '0883', 'voice': 'ne_NP/ne-google_low',
-         'meta': {'offline': True, 'display_name': 'Ne-Google - 0883', 'gender': '', 'priority': 50}},
-        {'speaker': '2027', 'voice': 'ne_NP/ne-google_low',
-         'meta': {'offline': True, 'display_name': 'Ne-Google - 2027', 'gender': '', 'priority': 50}},
-        {'speaker': '0649', 'voice': 'ne_NP/ne-google_low',
-         'meta': {'offline': True, 'display_name': 'Ne-Google - 0649', 'gender': '', 'priority': 50}}],
-    'nl': [
-        {'speaker': 'default', 'voice': 'nl/bart-de-leeuw_low',
-         'meta': {'offline': True, 'display_name': 'Bart-De-Leeuw', 'gender': '', 'priority': 40}},
-        {'speaker': 'default', 'voice': 'nl/flemishguy_low',
-         'meta': {'offline': True, 'display_name': 'Flemishguy', 'gender': '', 'priority': 40}},
-        {'speaker': 'default', 'voice': 'nl/nathalie_low',
-         'meta': {'offline': True, 'display_name': 'Nathalie', 'gender': '', 'priority': 40}},
-        {'speaker': 'default', 'voice': 'nl/pmk_low',
-         'meta': {'offline': True, 'display_name': 'Pmk', 'gender': '', 'priority': 50}},
-        {'speaker': 'default', 'voice': 'nl/rdh_low',
-         'meta': {'offline': True, 'display_name': 'Rdh', 'gender': '', 'priority': 50}}],
-    'pl-pl': [
-        {'speaker': 'piotr_nater', 'voice': 'pl_PL/m-ailabs_low',
-         'meta': {'offline': True, 'display_name': 'M-Ailabs - Piotr Nater', 'gender': '', 'priority': 40}},
-        {'speaker': 'nina_brown', 'voice': 'pl_PL/m-ailabs_low',
-         'meta': {'offline': True, 'display_name': 'M-Ailabs - Nina Brown', 'gender': '', 'priority': 40}}],
-    'ru-ru': [
-        {'speaker': 'hajdurova', 'voice': 'ru_RU/multi_low',
-         'meta': {'offline': True, 'display_name': 'Multi - Hajdurova', 'gender': '', 'priority': 50}},
-        {'speaker': 'minaev', 'voice': 'ru_RU/multi_low',
-         'meta': {'offline': True, 'display_name': 'Multi - Minaev', 'gender': '', 'priority': 50}},
-        {'speaker': 'nikolaev', 'voice': 'ru_RU/multi_low',
-         'meta': {'offline': True, 'display_name': 'Multi - Nikolaev', 'gender': '', 'priority': 50}}],
-    'sw': [
-        {'speaker': 'default', 'voice': 'sw/lanfrica_low',
-         'meta': {'offline': True, 'display_name': 'Lanfrica', 'gender': '', 'priority': 50}}],
-    'te-in': [
-        {'speaker': 'ss', 'voice': 'te_IN/cmu-indic_low',
-         'meta': {'offline': True, 'display_name': 'Cmu-Indic - Ss', 'gender': '', 'priority': 50}},
-        {'speaker': 'sk', 'voice': 'te_IN/cmu-indic_low',
-         'meta': {'offline': True, 'display_name': 'Cmu-Indic - Sk', 'gender': '', 'priority': 50}},
-        {'speaker': 'kpn', 'voice': 'te_IN/cmu-indic_low',
-         'meta': {'offline': True, 'display_name': 'Cmu-Indic - Kpn', 'gender': '', 'priority': 50}}],
-    'tn-za': [
-        {'speaker': '1932', 'voice': 'tn_ZA/google-nwu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Nwu - 1932', 'gender': '', 'priority': 50}},
-        {'speaker': '0045', 'voice': 'tn_ZA/google-nwu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Nwu - 0045', 'gender': '', 'priority': 50}},
-        {'speaker': '3342', 'voice': 'tn_ZA/google-nwu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Nwu - 3342', 'gender': '', 'priority': 50}},
-        {'speaker': '4850', 'voice': 'tn_ZA/google-nwu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Nwu - 4850', 'gender': '', 'priority': 50}},
-        {'speaker': '6206', 'voice': 'tn_ZA/google-nwu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Nwu - 6206', 'gender': '', 'priority': 50}},
-        {'speaker': '3629', 'voice': 'tn_ZA/google-nwu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Nwu - 3629', 'gender': '', 'priority': 50}},
-        {'speaker': '9061', 'voice': 'tn_ZA/google-nwu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Nwu - 9061', 'gender': '', 'priority': 50}},
-        {'speaker': '6116', 'voice': 'tn_ZA/google-nwu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Nwu - 6116', 'gender': '', 'priority': 50}},
-        {'speaker': '7674', 'voice': 'tn_ZA/google-nwu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Nwu - 7674', 'gender': '', 'priority': 50}},
-        {'speaker': '0378', 'voice': 'tn_ZA/google-nwu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Nwu - 0378', 'gender': '', 'priority': 50}},
-        {'speaker': '5628', 'voice': 'tn_ZA/google-nwu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Nwu - 5628', 'gender': '', 'priority': 50}},
-        {'speaker': '8333', 'voice': 'tn_ZA/google-nwu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Nwu - 8333', 'gender': '', 'priority': 50}},
-        {'speaker': '8512', 'voice': 'tn_ZA/google-nwu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Nwu - 8512', 'gender': '', 'priority': 50}},
-        {'speaker': '0441', 'voice': 'tn_ZA/google-nwu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Nwu - 0441', 'gender': '', 'priority': 50}},
-        {'speaker': '6459', 'voice': 'tn_ZA/google-nwu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Nwu - 6459', 'gender': '', 'priority': 50}},
-        {'speaker': '4506', 'voice': 'tn_ZA/google-nwu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Nwu - 4506', 'gender': '', 'priority': 50}},
-        {'speaker': '7866', 'voice': 'tn_ZA/google-nwu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Nwu - 7866', 'gender': '', 'priority': 50}},
-        {'speaker': '8532', 'voice': 'tn_ZA/google-nwu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Nwu - 8532', 'gender': '', 'priority': 50}},
-        {'speaker': '2839', 'voice': 'tn_ZA/google-nwu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Nwu - 2839', 'gender': '', 'priority': 50}},
-        {'speaker': '7896', 'voice': 'tn_ZA/google-nwu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Nwu - 7896', 'gender': '', 'priority': 50}},
-        {'speaker': '1498', 'voice': 'tn_ZA/google-nwu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Nwu - 1498', 'gender': '', 'priority': 50}},
-        {'speaker': '1483', 'voice': 'tn_ZA/google-nwu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Nwu - 1483', 'gender': '', 'priority': 50}},
-        {'speaker': '8914', 'voice': 'tn_ZA/google-nwu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Nwu - 8914', 'gender': '', 'priority': 50}},
-        {'speaker': '6234', 'voice': 'tn_ZA/google-nwu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Nwu - 6234', 'gender': '', 'priority': 50}},
-        {'speaker': '9365', 'voice': 'tn_ZA/google-nwu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Nwu - 9365', 'gender': '', 'priority': 50}},
-        {'speaker': '7693', 'voice': 'tn_ZA/google-nwu_low',
-         'meta': {'offline': True, 'display_name': 'Google-Nwu - 7693', 'gender': '', 'priority': 50}}],
-    'uk-uk': [
-        {'speaker': 'obruchov', 'voice': 'uk_UK/m-ailabs_low',
-         'meta': {'offline': True, 'display_name': 'M-Ailabs - Obruchov', 'gender': '', 'priority': 40}},
-        {'speaker': 'shepel', 'voice': 'uk_UK/m-ailabs_low',
-         'meta': {'offline': True, 'display_name': 'M-Ailabs - Shepel', 'gender': '', 'priority': 40}},
-        {'speaker': 'loboda', 'voice': 'uk_UK/m-ailabs_low',
-         'meta': {'offline': True, 'display_name': 'M-Ailabs - Loboda', 'gender': '', 'priority': 40}},
-        {'speaker': 'miskun', 'voice': 'uk_UK/m-ailabs_low',
-         'meta': {'offline': True, 'display_name': 'M-Ailabs - Miskun', 'gender': '', 'priority': 40}},
-        {'speaker': 'sumska', 'voice': 'uk_UK/m-ailabs_low',
-         'meta': {'offline': True, 'display_name': 'M-Ailabs - Sumska', 'gender': '', 'priority': 40}},
-        {'speaker': 'pysariev', 'voice': 'uk_UK/m-ailabs_low',
-         'meta': {'offline': True, 'display_name': 'M-Ailabs - Pysariev', 'gender': '', 'priority': 40}}],
-    'vi-vn': [
-        {'speaker': 'default', 'voice': 'vi_VN/vais1000_low',
-         'meta': {'offline': True, 'display_name': 'Vais1000', 'gender': '', 'priority': 50}}],
-    'yo': [
-        {'speaker': 'default', 'voice': 'yo/openbible_low',
-         'meta': {'offline': True, 'display_name': 'Openbible', 'gender': '', 'priority': 50}}]}
+
+def _display_name(voice: str, speaker: str) -> str:
+    name = voice.split("/")[-1].rsplit("_", 1)[0].title()
+    if speaker == "default":
+        return name
+    return f"{name} - {speaker.replace('_', ' ').title()}"
+
+
+class _LazyVoices(Mapping):
+    """lang -> list of voice configs, each lang file is read on first access"""
+
+    def __init__(self, voices_dir: str = _VOICES_DIR):
+        self._dir = voices_dir
+        self._langs: typing.Optional[typing.List[str]] = None
+        self._loaded: typing.Dict[str, list] = {}
+
+    @property
+    def langs(self) -> typing.List[str]:
+        if self._langs is None:
+            self._langs = sorted(f[:-5] for f in listdir(self._dir) if f.endswith(".json"))
+        return self._langs
+
+    def __getitem__(self, lang: str) -> list:
+        if lang not in self._loaded:
+            if lang not in self.langs:
+                raise KeyError(lang)
+            with open(join(self._dir, f"{lang}.json")) as f:
+                rows = json.load(f)
+            # json returns a new str per row, intern the repeated ids
+            self._loaded[lang] = [
+                {"speaker": sys.intern(speaker), "voice": sys.intern(voice),
+                 "meta": {"offline": True, "display_name": _display_name(voice, speaker),
+                          "gender": sys.intern(gender), "priority": priority}}
+                for voice, speaker, gender, priority in rows]
+        return self._loaded[lang]
+
+    def __contains__(self, lang) -> bool:
+        # Mapping's default goes through __getitem__ and would load the file
+        return lang in self.langs
+
+    def __iter__(self):
+        return iter(self.langs)
+
+    def __len__(self) -> int:
+        return len(self.langs)
+
+
+Mimic3TTSPluginConfig = _LazyVoices()
 
 if __name__ == "__main__":
     tt = Mimic3TTSPlugin()
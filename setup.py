@@ -69,6 +69,7 @@ setup(
     author="Michael Hansen",
     license="AGPL",
     packages=['ovos_tts_plugin_mimic3'],
+    package_data={'ovos_tts_plugin_mimic3': ['data/voices/*.json']},
     install_requires=required("requirements.txt"),
     extras_require=get_lang_extras(),
     classifiers=[
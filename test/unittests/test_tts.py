@@ -1,6 +1,15 @@
+import asyncio
+import threading
 import unittest
+import wave
+from collections import OrderedDict
+from types import SimpleNamespace
+from unittest.mock import patch
 
-from ovos_tts_plugin_mimic3 import Mimic3TTSPlugin
+from mimic3_tts import AudioResult
+
+from ovos_tts_plugin_mimic3 import Mimic3TTSPlugin, Mimic3TTSPluginConfig, _LazyVoices, \
+    _override_speaker, _wav_header
 
 
 class TestTTS(unittest.TestCase):
@@ -12,3 +21,287 @@ class TestTTS(unittest.TestCase):
         path = "/tmp/hello.wav"
         audio, phonemes = self.mimic.get_tts("hello world", path)
         self.assertEqual(audio, path)
+
+    def test_text_hacks(self):
+        self.assertEqual(Mimic3TTSPlugin._apply_text_hacks("hello world"),
+                         ("hello world", False))
+        self.assertEqual(Mimic3TTSPlugin._apply_text_hacks("at eight a.m.next"),
+                         ("at eight a.m. next", False))
+        self.assertEqual(Mimic3TTSPlugin._apply_text_hacks("talk to A I"),
+                         ("talk to A.I. ", False))
+        self.assertEqual(Mimic3TTSPlugin._apply_text_hacks("A;"),
+                         ('<say-as interpret-as="spell-out">A</say-as>', True))
+        self.assertEqual(Mimic3TTSPlugin._apply_text_hacks("letter 'B'"),
+                         ('letter <say-as interpret-as="spell-out">B</say-as>', True))
+
+    def test_wav_header(self):
+        path = "/tmp/header.wav"
+        pcm = b"\x01\x00\x02\x00" * 100
+        with open(path, "wb") as f:
+            f.write(_wav_header(16000, 2, 2, len(pcm)))
+            f.write(pcm)
+        with wave.open(path, "rb") as w:
+            self.assertEqual(w.getframerate(), 16000)
+            self.assertEqual(w.getsampwidth(), 2)
+            self.assertEqual(w.getnchannels(), 2)
+            self.assertEqual(w.getnframes(), 100)
+            self.assertEqual(w.readframes(100), pcm)
+
+    def test_wav_cache(self):
+        with patch.object(self.mimic, "_wav_cache_size", 2), \
+                patch.object(self.mimic, "_wav_cache", OrderedDict()):
+            self.mimic._cache_put(("a",), b"a")
+            self.mimic._cache_put(("b",), b"b")
+            self.assertEqual(self.mimic._cache_get(("a",)), b"a")  # "a" is now most recent
+            self.mimic._cache_put(("c",), b"c")  # evicts "b"
+            self.assertIsNone(self.mimic._cache_get(("b",)))
+            self.assertEqual(self.mimic._cache_get(("a",)), b"a")
+            self.assertEqual(self.mimic._cache_get(("c",)), b"c")
+
+            # a repeated sentence is served from the cache without synthesis
+            with patch.object(self.mimic, "_mimic3_synth",
+                              wraps=self.mimic._mimic3_synth) as synth:
+                self.mimic.get_tts("cached sentence", "/tmp/cache1.wav")
+                self.mimic.get_tts("cached sentence", "/tmp/cache2.wav")
+                self.assertEqual(synth.call_count, 1)
+            with open("/tmp/cache1.wav", "rb") as f1, open("/tmp/cache2.wav", "rb") as f2:
+                self.assertEqual(f1.read(), f2.read())
+
+    def test_wav_cache_disabled_by_default(self):
+        self.assertEqual(Mimic3TTSPlugin(config={"preload_langs": []})._wav_cache_size, 0)
+
+    def test_stream_tts(self):
+        async def collect():
+            return [chunk async for chunk in self.mimic.stream_tts("hello world")]
+
+        chunks = asyncio.run(collect())
+        self.assertGreater(len(chunks), 1)
+        header = chunks[0]
+        self.assertEqual(len(header), 44)
+        self.assertEqual(header[:4], b"RIFF")
+        self.assertEqual(header[8:16], b"WAVEfmt ")
+        self.assertEqual(header[36:40], b"data")
+        self.assertTrue(all(chunks[1:]))
+
+    def test_config(self):
+        voices = _LazyVoices()
+        self.assertEqual(voices._loaded, {})
+        self.assertEqual(len(voices), 26)
+        self.assertIn("en-us", voices)
+        self.assertNotIn("xx-xx", voices)
+        self.assertEqual(voices._loaded, {})  # listing langs loads nothing
+
+        self.assertEqual(len(voices["de-de"]), 14)
+        self.assertEqual(list(voices._loaded), ["de-de"])
+        self.assertEqual(voices["de-de"][3], {
+            'speaker': 'disgusted', 'voice': 'de_DE/thorsten-emotion_low',
+            'meta': {'offline': True, 'display_name': 'Thorsten-Emotion - Disgusted',
+                     'gender': '', 'priority': 45}})
+        self.assertEqual(voices["vi-vn"], [{
+            'speaker': 'default', 'voice': 'vi_VN/vais1000_low',
+            'meta': {'offline': True, 'display_name': 'Vais1000', 'gender': '', 'priority': 50}}])
+
+        # same languages and row counts as the table that used to be inline
+        counts = {'af-za': 9, 'bn': 16, 'de-de': 14, 'el-gr': 1, 'en-gb': 1, 'en-us': 124,
+                  'es-es': 4, 'fa': 1, 'fi-fi': 1, 'fr-fr': 7, 'gu-in': 3, 'ha-ne': 1,
+                  'hu-hu': 1, 'it-it': 40, 'jv-id': 39, 'ko-ko': 1, 'ne-np': 18, 'nl': 5,
+                  'pl-pl': 2, 'ru-ru': 3, 'sw': 1, 'te-in': 3, 'tn-za': 26, 'uk-uk': 6,
+                  'vi-vn': 1, 'yo': 1}
+        self.assertEqual({lang: len(rows) for lang, rows in Mimic3TTSPluginConfig.items()}, counts)
+        self.assertEqual(self.mimic.available_languages, set(counts))
+
+    def test_get_voices(self):
+        fake = [SimpleNamespace(key="en_US/a_low", language="en_US"),
+                SimpleNamespace(key="en_UK/b_low", language="en_UK"),
+                SimpleNamespace(key="de_DE/c_low", language="de_DE")]
+        with patch.object(self.mimic, "_voices", fake):
+            self.assertEqual([v.key for v in self.mimic.get_voices("en-us")], ["en_US/a_low"])
+            self.assertEqual([v.key for v in self.mimic.get_voices("en-gb")], ["en_UK/b_low"])
+            self.assertEqual([v.key for v in self.mimic.get_voices("en")],
+                             ["en_US/a_low", "en_UK/b_low"])
+            self.assertEqual([v.key for v in self.mimic.get_voices("de_DE")], ["de_DE/c_low"])
+            self.assertEqual(self.mimic.get_voices(), fake)
+
+    def test_prefetch_tts(self):
+        wav_bytes = self.mimic.prefetch_tts("prefetched sentence").result(timeout=5)
+        self.assertEqual(wav_bytes[:4], b"RIFF")
+        self.assertEqual(wav_bytes[8:12], b"WAVE")
+
+        # the synthesis error is reported, not a failure to clean up the temp file
+        with patch.object(Mimic3TTSPlugin, "_iter_audio", side_effect=RuntimeError("boom")):
+            with self.assertRaisesRegex(RuntimeError, "boom"):
+                self.mimic.prefetch_tts("bad").result(timeout=5)
+
+    def test_warmup(self):
+        # the default voice of the plugin lang is preloaded once
+        config = {"preload_voices": ["en_US/cmu-arctic_low"]}
+        with patch.object(Mimic3TTSPlugin, "_iter_audio", return_value=iter([])) as synth:
+            Mimic3TTSPlugin(config=dict(config))
+            synth.assert_called_once()
+        with patch.object(Mimic3TTSPlugin, "_iter_audio") as synth:
+            Mimic3TTSPlugin(config=dict(config, warmup=False))
+            synth.assert_not_called()
+
+        # a failed warmup doesn't prevent the plugin from loading
+        config = dict(config, preload_voices=["de_DE/thorsten_low"])
+        for parallel in (True, False):
+            with patch.object(Mimic3TTSPlugin, "_iter_audio", side_effect=RuntimeError("boom")):
+                tts = Mimic3TTSPlugin(config=dict(config, parallel_preload=parallel))
+            self.assertIn("de_DE/thorsten_low", tts._engines)
+
+    def test_override_speaker(self):
+        engine = SimpleNamespace(speaker="default")
+        with _override_speaker(engine, "other"):
+            self.assertEqual(engine.speaker, "other")
+        self.assertEqual(engine.speaker, "default")
+
+        # mimic3 clears the speaker when SSML switches the voice
+        with _override_speaker(engine, None):
+            engine.speaker = None
+        self.assertEqual(engine.speaker, "default")
+
+        with self.assertRaises(RuntimeError):
+            with _override_speaker(engine, "other"):
+                raise RuntimeError("boom")
+        self.assertEqual(engine.speaker, "default")
+
+    def test_stream_tts_early_stop(self):
+        _, lock = self.mimic._get_engine(self.mimic.voice)
+        closed = threading.Event()
+        produced = []
+
+        def iter_audio(engine, text, ssml=False):
+            for i in range(100):
+                if i:
+                    closed.wait(5)
+                produced.append(i)
+                yield AudioResult(sample_rate_hz=22050, sample_width_bytes=2,
+                                  num_channels=1, audio_bytes=b"\x00\x00" * 10)
+
+        async def read_one():
+            stream = self.mimic.stream_tts("hello world")
+            header = await stream.__anext__()
+            await stream.__anext__()
+            await stream.aclose()
+            closed.set()
+            return header
+
+        with patch.object(Mimic3TTSPlugin, "_iter_audio", side_effect=iter_audio):
+            self.assertEqual(asyncio.run(read_one())[:4], b"RIFF")
+        # asyncio.run waits for the producer thread, it stopped after the next chunk
+        self.assertLess(len(produced), 100)
+        self.assertFalse(lock.locked())
+
+        async def cancel_while_waiting():
+            stream = self.mimic.stream_tts("hello world")
+            task = asyncio.ensure_future(stream.__anext__())
+            await asyncio.sleep(0.1)  # the producer is waiting for the engine lock
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            lock.release()
+
+        # nothing is synthesized for a consumer that left while the voice was busy
+        with patch.object(Mimic3TTSPlugin, "_iter_audio") as synth:
+            lock.acquire()
+            asyncio.run(cancel_while_waiting())
+            synth.assert_not_called()
+        self.assertFalse(lock.locked())
+
+    def test_stream_tts_error(self):
+        async def collect():
+            return [chunk async for chunk in self.mimic.stream_tts("hello world")]
+
+        with patch.object(Mimic3TTSPlugin, "_iter_audio", side_effect=RuntimeError("boom")):
+            with self.assertRaisesRegex(RuntimeError, "boom"):
+                asyncio.run(collect())
+        self.assertFalse(self.mimic._get_engine(self.mimic.voice)[1].locked())
+
+    def test_engine_pool(self):
+        tts = Mimic3TTSPlugin(config={"speaker": "fem"})
+        engine, lock = tts._get_engine("en_US/cmu-arctic_low")
+        self.assertIs(engine, tts.tts)
+        self.assertEqual(tts._get_engine("en_US/cmu-arctic_low"), (engine, lock))
+
+        # each voice gets its own engine and lock
+        tts.get_tts("hallo welt", "/tmp/pool.wav", voice="de_DE/thorsten_low")
+        de_engine, de_lock = tts._engines["de_DE/thorsten_low"]
+        self.assertIsNot(de_engine, engine)
+        self.assertIsNot(de_lock, lock)
+
+        # a per request speaker doesn't change the engine default
+        tts.get_tts("hello world", "/tmp/pool.wav", voice="en_US/cmu-arctic_low#slt")
+        self.assertEqual(engine.speaker, "fem")
+
+        # a busy voice doesn't block requests for other voices
+        with lock:
+            thread = threading.Thread(target=tts.get_tts, args=("hallo welt", "/tmp/pool.wav"),
+                                      kwargs={"voice": "de_DE/thorsten_low"})
+            thread.start()
+            thread.join(5)
+            self.assertFalse(thread.is_alive())
+
+    def test_concurrent_requests(self):
+        tts = Mimic3TTSPlugin(config={"concurrent_requests": 1})
+        done = threading.Event()
+
+        def synth():
+            tts.get_tts("hallo welt", "/tmp/sem.wav", voice="de_DE/thorsten_low")
+            done.set()
+
+        with tts._sem:
+            thread = threading.Thread(target=synth)
+            thread.start()
+            # the only synthesis slot is taken
+            self.assertFalse(done.wait(0.1))
+        thread.join(5)
+        self.assertTrue(done.is_set())
+
+    def test_engine_lookup_lock_free(self):
+        engines = []
+        thread = threading.Thread(target=lambda: engines.append(self.mimic._get_engine(self.mimic.voice)))
+        # an existing engine is returned without waiting for the registry lock
+        with self.mimic._engines_lock:
+            thread.start()
+            thread.join(5)
+            self.assertFalse(thread.is_alive())
+        self.assertIs(engines[0][0], self.mimic.tts)
+
+    def test_resolve_voice(self):
+        self.assertEqual(self.mimic._resolve_voice("de-de"), "de_DE/thorsten_low")
+        self.assertEqual(self.mimic._resolve_voice("en-gb"), "en_UK/apope_low")
+        self.assertIsNone(self.mimic._resolve_voice("xx-yy"))
+
+        # a full lang code resolved through its base lang still unpacks
+        self.assertEqual(self.mimic._validate_args_combo(lang="de-de"),
+                         ("de_DE/thorsten_low", None, "de_DE"))
+        with self.assertRaises(ValueError):
+            self.mimic._validate_args_combo(lang="xx-yy")
+
+        # another instance registering its voice doesn't change this one
+        tts = Mimic3TTSPlugin(lang="de-de", config={"voice": "de_DE/m-ailabs_low",
+                                                    "preload_langs": ["de-de"]})
+        self.assertEqual(tts._resolve_voice("de-de"), "de_DE/m-ailabs_low")
+        self.assertEqual(self.mimic._resolve_voice("de-de"), "de_DE/thorsten_low")
+        self.assertEqual(Mimic3TTSPlugin.default_voices["de"], "de_DE/thorsten_low")
+        self.assertNotIn("de-de", Mimic3TTSPlugin.default_voices)
+
+    def test_parallel_preload(self):
+        config = {"preload_voices": ["de_DE/thorsten_low", "en_US/vctk_low#p236"],
+                  "preload_langs": ["en-us", "de"], "warmup": False}
+        for parallel in (True, False):
+            threads = {}
+
+            def preload(tts, voice):
+                threads[voice] = threading.current_thread()
+
+            with patch.object(Mimic3TTSPlugin, "_preload_voice", autospec=True, side_effect=preload):
+                Mimic3TTSPlugin(config=dict(config, parallel_preload=parallel))
+            # preload_voices and the lang defaults, without duplicates
+            self.assertCountEqual(threads, ["de_DE/thorsten_low", "en_US/vctk_low#p236",
+                                            "en_US/cmu-arctic_low"])
+            main = threading.current_thread()
+            if parallel:
+                self.assertNotIn(main, threads.values())
+            else:
+                self.assertEqual(set(threads.values()), {main})